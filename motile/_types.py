@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Hashable, TypeAlias, Union
+from typing import TYPE_CHECKING, Any, Hashable, TypeAlias, Union
+
+import ilpy
 
 # Nodes are represented as integers, or a "meta-node" tuple of integers.
 NodeId: TypeAlias = Union[int, tuple[int, ...]]
@@ -14,3 +16,11 @@ GraphObject: TypeAlias = dict[Hashable, Any]
 # ((0, 1), 2) is a hyperedge from nodes 0 and 1 to node 2 (i.e. a merge).
 # ((0,), (1, 2)) is a hyperedge from node 0 to nodes 1 and 2 (i.e. a split).
 EdgeId: TypeAlias = tuple[NodeId, ...]
+
+# Collection of linear constraints. Newer ilpy versions renamed
+# LinearConstraints to Constraints and warn when the old name is accessed, so
+# the new name is looked up first.
+if TYPE_CHECKING:
+    LinearConstraints: TypeAlias = ilpy.Constraints
+else:
+    LinearConstraints = getattr(ilpy, "Constraints", None) or ilpy.LinearConstraints
@@ -6,12 +6,15 @@ from typing import TYPE_CHECKING, Iterable
 if TYPE_CHECKING:
     import ilpy
 
+    from motile._types import LinearConstraints
     from motile.solver import Solver
 
 
 class Constraint(ABC):
     @abstractmethod
-    def instantiate(self, solver: Solver) -> Iterable[ilpy.LinearConstraint]:
+    def instantiate(
+        self, solver: Solver
+    ) -> Iterable[ilpy.LinearConstraint] | LinearConstraints:
         """Create and return specific linear constraints for the given solver.
 
         Args:
@@ -21,5 +24,7 @@ class Constraint(ABC):
 
         Returns:
 
-            An iterable of :class:`ilpy.LinearConstraint`.
+            An iterable of :class:`ilpy.LinearConstraint`. Alternatively, an
+            :class:`ilpy.LinearConstraints` collection, which the solver adds in
+            a single call.
         """
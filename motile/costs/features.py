@@ -45,6 +45,42 @@ class Features:
 
         self._values[variable_index, feature_index] += value
 
+    def add_features(
+        self, variable_indices: np.ndarray, feature_index: int, values: np.ndarray
+    ) -> None:
+        """Add values to one feature of several variables at once.
+
+        Same as calling :func:`add_feature` for each pair of variable index and
+        value: the features are resized if needed, and values for repeated
+        variable indices are summed.
+
+        Args:
+
+            variable_indices (``ndarray``):
+                1-D array of integer variable indices.
+
+            feature_index (``int``):
+                The index of the feature to add the values to.
+
+            values (``ndarray``):
+                1-D array of values, of the same length as
+                ``variable_indices``.
+        """
+        num_variables, num_features = self._values.shape
+
+        if len(variable_indices) == 0:
+            return
+
+        max_variable_index = int(variable_indices.max())
+        if max_variable_index >= num_variables or feature_index >= num_features:
+            self.resize(
+                max(max_variable_index + 1, num_variables),
+                max(feature_index + 1, num_features),
+            )
+
+        # unbuffered, so that repeated variable indices accumulate
+        np.add.at(self._values[:, feature_index], variable_indices, values)
+
     def to_ndarray(self) -> np.ndarray:
         # _values is already an ndarray, but this might change in the future
         # Note: consider implementing
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from ..variables import NodeSelected
 from .costs import Costs
 from .weight import Weight
@@ -37,8 +39,20 @@ class NodeSelection(Costs):
     def apply(self, solver: Solver) -> None:
         node_variables = solver.get_variables(NodeSelected)
 
-        for node, index in node_variables.items():
-            solver.add_variable_cost(
-                index, solver.graph.nodes[node][self.attribute], self.weight
-            )
-            solver.add_variable_cost(index, 1.0, self.constant)
+        # resolve attributes once, not once per node
+        nodes = solver.graph.nodes
+        attribute = self.attribute
+
+        items = list(node_variables.items())
+        num_items = len(items)
+        indices = np.fromiter(
+            (index for _, index in items), dtype=np.int64, count=num_items
+        )
+        costs = np.fromiter(
+            (nodes[node][attribute] for node, _ in items),
+            dtype=np.float64,
+            count=num_items,
+        )
+
+        solver.add_variable_costs(indices, costs, self.weight)
+        solver.add_variable_costs(indices, np.ones_like(costs), self.constant)
@@ -1,14 +1,17 @@
-import numpy as np
+import re
+from functools import lru_cache, reduce
 
-try:
-    import plotly.graph_objects as go
-except ImportError as e:
-    raise ImportError(
-        "This functionality requires the plotly package. Please install plotly."
-    ) from e
+import numpy as np
 
 from .variables import EdgeSelected, NodeSelected
 
+# number of nodes and edges above which plots are rendered with WebGL
+_WEBGL_THRESHOLD = 2000
+
+# needed for arrow heads oriented along their edge
+_MIN_PLOTLY_VERSION = (5, 11)
+_MIN_PLOTLY_VERSION_STR = "5.11"
+
 
 def draw_track_graph(
     graph,
@@ -27,10 +30,14 @@ def draw_track_graph(
     """Create a plotly figure showing the given graph, with time on the x-axis
     and node positions on the y-axis.
 
+    Requires ``plotly`` 5.11 or newer. Edge labels are drawn as text in the
+    edge color next to each edge, without a background box.
+
     Args:
 
         graph (:class:`TrackGraph`):
-            The graph to plot.
+            The graph to plot. Hyperedges are drawn as one arrow for each pair
+            of nodes they connect, with a single label.
 
         position_attribute (``string``):
             The name of the node attribute to use to place nodes on the y-axis.
@@ -63,9 +70,15 @@ def draw_track_graph(
 
     Returns:
 
-        ``plotly`` figure showing the graph.
+        ``plotly`` figure showing the graph. For graphs with more than 2000
+        nodes and edges, nodes, edges, and labels are rendered with WebGL
+        (``Scattergl`` traces), which is much faster to display but renders
+        text labels slightly differently. Arrow heads always use SVG, since
+        WebGL markers can not be oriented along their edge.
     """
 
+    go = _import_plotly()
+
     if position_attribute is not None and position_func is not None:
         raise RuntimeError(
             "Only one of position_attribute and position_func can be given"
@@ -74,11 +87,6 @@ def draw_track_graph(
     if position_attribute is None:
         position_attribute = "x"
 
-    if position_func is None:
-
-        def position_func(node):
-            return graph.nodes[node][position_attribute]
-
     if alpha_attribute is not None and alpha_func is not None:
         raise RuntimeError("Only one of alpha_attribute and alpha_func can be given")
 
@@ -108,6 +116,10 @@ def draw_track_graph(
     if label_attribute is not None and label_func is not None:
         raise RuntimeError("Only one of label_attribute and label_func can be given")
 
+    # only the default labels are known to be strings already, attribute
+    # values and user-provided labels are converted with str()
+    labels_are_str = False
+
     if label_attribute is not None:
 
         def label_node_func(node):
@@ -117,12 +129,9 @@ def draw_track_graph(
             return graph.edges[edge].get(label_attribute, "")
 
     elif label_func is None:
-
-        def label_node_func(node):
-            return str(node)
-
-        def label_edge_func(edge):
-            return str(edge)
+        label_node_func = str
+        label_edge_func = str
+        labels_are_str = True
 
     else:
         try:
@@ -132,45 +141,152 @@ def draw_track_graph(
             label_edge_func = label_func
 
     frame_attribute = graph.frame_attribute
-    frames = list(range(*graph.get_frames()))
-
-    node_positions = np.asarray(
-        [
-            (attrs[frame_attribute], position_func(node))
-            for node, attrs in graph.nodes.items()
-        ]
+    t_begin, _ = graph.get_frames()
+
+    num_nodes = len(graph.nodes)
+    num_edges = len(graph.edges)
+
+    # Gather everything needed per node and edge in a single pass each. Edges
+    # refer to nodes by their ID, which is not necessarily a row index into
+    # node_data. Without a position_func, positions are read directly from the
+    # node attributes.
+    node_to_row = {}
+    node_data = np.empty(
+        (num_nodes,),
+        dtype=[("frame", np.float64), ("position", np.float64), ("alpha", np.float64)],
     )
-    node_alphas = [alpha_node_func(node) for node in graph.nodes]
-    edge_alphas = [alpha_edge_func(edge) for edge in graph.edges]
+    node_labels = [""] * num_nodes
+    node_hovertexts = [""] * num_nodes
+    for row, (node, attrs) in enumerate(graph.nodes.items()):
+        node_to_row[node] = row
+        if position_func is None:
+            position = attrs[position_attribute]
+        else:
+            position = position_func(node)
+        node_data[row] = (attrs[frame_attribute], position, alpha_node_func(node))
+        label = label_node_func(node)
+        node_labels[row] = label if labels_are_str else str(label)
+        node_hovertexts[row] = _attr_hover_text(attrs)
+
+    # Each edge is drawn as one or more segments between nodes. Hyperedges
+    # have one segment per pair of nodes they connect.
+    u_idx = []
+    v_idx = []
+    segment_edges = []
+    edge_alphas = np.empty((num_edges,), dtype=np.float64)
+    edge_labels = [""] * num_edges
+    edge_hovertexts = [""] * num_edges
+    for row, (edge, attrs) in enumerate(graph.edges.items()):
+        for u, v in _edge_node_pairs(edge, node_to_row):
+            u_idx.append(node_to_row[u])
+            v_idx.append(node_to_row[v])
+            segment_edges.append(row)
+        edge_alphas[row] = alpha_edge_func(edge)
+        label = label_edge_func(edge)
+        edge_labels[row] = label if labels_are_str else str(label)
+        edge_hovertexts[row] = _attr_hover_text(attrs)
+
     # can be a list for different colors per node/edge
-    node_colors = to_rgba(node_color, node_alphas)
+    node_colors = to_rgba(node_color, node_data["alpha"])
     edge_colors = to_rgba(edge_color, edge_alphas)
 
-    node_labels = [str(label_node_func(node)) for node in graph.nodes]
-    edge_labels = [str(label_edge_func(edge)) for edge in graph.edges]
+    # Edges are drawn as line segments (separated by gaps) in a single trace
+    # per edge color, instead of one annotation per edge. Arrow heads are
+    # markers oriented along the segment they terminate, the (invisible)
+    # marker at the start of each segment only serves as a reference point.
+    node_positions = np.stack((node_data["frame"], node_data["position"]), axis=1)
+    segment_edges_arr = np.array(segment_edges, dtype=np.intp)
+    starts = node_positions[np.array(u_idx, dtype=np.intp)]
+    ends = node_positions[np.array(v_idx, dtype=np.intp)]
+    num_segments = len(segment_edges_arr)
+
+    # labels are placed at the mean of the midpoints of an edge's segments
+    mids = np.zeros((num_edges, 2), dtype=np.float64)
+    np.add.at(mids, segment_edges_arr, 0.6 * starts + 0.4 * ends)
+    mids /= np.bincount(segment_edges_arr, minlength=num_edges)[:, np.newaxis]
+
+    # (num_segments, 3, 2) array of start, end, and gap per segment
+    gaps = np.full_like(starts, np.nan)
+    segments = np.stack((starts, ends, gaps), axis=1)
+
+    # group segments by color with a single sort, rather than masking all
+    # segments once per distinct color
+    segment_colors = np.asarray(edge_colors)[segment_edges_arr]
+    line_colors, color_idx, color_counts = np.unique(
+        segment_colors, return_inverse=True, return_counts=True
+    )
+    grouped_segments = segments[np.argsort(color_idx, kind="stable")]
+    edge_lines = {
+        color: group.reshape(-1, 2)
+        for color, group in zip(
+            line_colors.tolist(),
+            np.split(grouped_segments, np.cumsum(color_counts)[:-1]),
+        )
+    }
+
+    arrows = segments.reshape(-1, 2)
+    arrow_colors = np.repeat(segment_colors, 3)
+    arrow_sizes = np.tile([0.0, node_size * 0.6, 0.0], num_segments)
 
-    def attr_hover_text(attrs):
-        return "<br>".join([f"{name}: {value}" for name, value in attrs.items()])
+    if num_nodes + num_edges > _WEBGL_THRESHOLD:
+        Scatter = go.Scattergl
+    else:
+        Scatter = go.Scatter
 
     fig = go.Figure()
 
-    node_trace = go.Scatter(
-        x=node_positions[:, 0],
-        y=node_positions[:, 1],
+    for color, line in edge_lines.items():
+        fig.add_trace(
+            Scatter(
+                x=line[:, 0],
+                y=line[:, 1],
+                mode="lines",
+                line={"color": color, "width": 4},
+                hoverinfo="skip",
+            )
+        )
+
+    arrow_trace = go.Scatter(
+        x=arrows[:, 0],
+        y=arrows[:, 1],
+        mode="markers",
+        marker={
+            "symbol": "arrow",
+            "angleref": "previous",
+            "size": arrow_sizes,
+            "color": arrow_colors,
+            "standoff": node_size * 0.8,
+        },
+        hoverinfo="skip",
+    )
+    label_trace = Scatter(
+        x=mids[:, 0],
+        y=mids[:, 1],
+        mode="text",
+        text=edge_labels,
+        textfont={"color": edge_colors},
+        hoverinfo="text",
+        hovertext=edge_hovertexts,
+    )
+    node_trace = Scatter(
+        x=node_data["frame"],
+        y=node_data["position"],
         mode="markers+text",
         marker={"color": node_colors, "size": 30},
         text=node_labels,
         textfont={"color": "white"},
         hoverinfo="text",
-        hovertext=[attr_hover_text(attrs) for attrs in graph.nodes.values()],
+        hovertext=node_hovertexts,
     )
 
+    fig.add_trace(arrow_trace)
+    fig.add_trace(label_trace)
     fig.add_trace(node_trace)
 
     fig.update_layout(
         xaxis={
             "tickmode": "linear",
-            "tick0": min(frames),
+            "tick0": t_begin,
             "dtick": 1,
             "title": "time",
         },
@@ -199,58 +315,6 @@ def draw_track_graph(
         height=height,
     )
 
-    arrows = []
-    for ((u, v), attrs), label, color in zip(
-        graph.edges.items(), edge_labels, edge_colors
-    ):
-        start = node_positions[u, (0, 1)]
-        end = node_positions[v, (0, 1)]
-        mid = 0.6 * start + 0.4 * end
-        first_half = go.layout.Annotation(
-            dict(
-                ax=start[0],
-                ay=start[1],
-                x=mid[0],
-                y=mid[1],
-                xref="x",
-                yref="y",
-                showarrow=True,
-                startstandoff=node_size / 2,
-                axref="x",
-                ayref="y",
-                arrowhead=0,
-                arrowwidth=4,
-                arrowcolor=color,
-            )
-        )
-        second_half = go.layout.Annotation(
-            dict(
-                ax=mid[0],
-                ay=mid[1],
-                x=end[0],
-                y=end[1],
-                xref="x",
-                yref="y",
-                text=label,
-                font={"color": "white"},
-                hovertext=attr_hover_text(attrs),
-                bgcolor=color,
-                showarrow=True,
-                standoff=node_size * 0.8,
-                axref="x",
-                ayref="y",
-                arrowhead=2,
-                arrowwidth=4,
-                arrowsize=0.6,
-                arrowcolor=color,
-            )
-        )
-
-        arrows.append(first_half)
-        arrows.append(second_half)
-
-    fig.update_layout(annotations=arrows)
-
     return fig
 
 
@@ -288,16 +352,96 @@ def draw_solution(graph, solver, *args, **kwargs):
     return draw_track_graph(graph, *args, **kwargs)
 
 
+def _edge_node_pairs(edge, node_to_row):
+    # Yield (u, v) for each pair of nodes connected by the given edge. Entries
+    # of a hyperedge are either a node or a tuple of nodes of the same frame,
+    # e.g., ((0,), (2, 3)). Node IDs can be tuples themselves, so an entry is
+    # only treated as a group of nodes if it is not a node.
+    groups = [(part,) if part in node_to_row else part for part in edge]
+    for in_nodes, out_nodes in zip(groups, groups[1:]):
+        for u in in_nodes:
+            for v in out_nodes:
+                yield u, v
+
+
+def _attr_hover_text(attrs):
+    # str.join builds a list from its argument anyway, passing a list directly
+    # is faster than passing a generator
+    return "<br>".join([f"{name}: {value}" for name, value in attrs.items()])
+
+
 def to_rgba(color, alpha=1.0):
     if isinstance(color, list):
-        if isinstance(alpha, list):
+        if isinstance(alpha, (list, np.ndarray)):
             return [to_rgba(c, a) for c, a in zip(color, alpha)]
         else:  # only color is list
             return [to_rgba(c, alpha) for c in color]
-    elif isinstance(alpha, list):  # only alpha is list
-        return [to_rgba(color, a) for a in alpha]
+    elif isinstance(alpha, (list, np.ndarray)):  # only alpha is list
+        return _to_rgba_array(color, alpha)
 
     # we fake alpha by mixing with white(ish)
     # transparancy is tricky...
     color = tuple(int(c * alpha + 220 * (1.0 - alpha)) for c in color)
     return f"rgb({color[0]},{color[1]},{color[2]})"
+
+
+def _to_rgba_array(color, alphas):
+    # same as to_rgba, but vectorized over an array of alphas
+    alphas = np.asarray(alphas, dtype=np.float64)
+    # like to_rgba, only the RGB components of the color are used
+    color = np.asarray(color, dtype=np.float64)[:3]
+    colors = np.broadcast_to(color, (len(alphas), 3))
+    mix_colors = _get_mix_colors()
+    mixed = mix_colors(np.ascontiguousarray(colors), alphas).astype(str)
+    return reduce(
+        np.char.add,
+        ("rgb(", mixed[:, 0], ",", mixed[:, 1], ",", mixed[:, 2], ")"),
+    ).tolist()
+
+
+def _mix_colors(colors, alphas):
+    # mix (N, 3) colors with white(ish) according to (N,) alphas
+    alphas = alphas[:, np.newaxis]
+    return (colors * alphas + 220 * (1.0 - alphas)).astype(np.int64)
+
+
+def _import_plotly():
+    # plotly is only imported when a figure is created, since importing it is
+    # slow and it is not needed for anything else
+    try:
+        import plotly
+        import plotly.graph_objects as go
+    except ImportError as e:
+        raise ImportError(
+            "This functionality requires the plotly package (version "
+            f"{_MIN_PLOTLY_VERSION_STR} or newer). Please install plotly."
+        ) from e
+
+    # oriented arrow head markers (marker.angleref) need a recent plotly
+    version = tuple(int(part) for part in re.findall(r"\d+", plotly.__version__)[:2])
+    if version < _MIN_PLOTLY_VERSION:
+        raise ImportError(
+            f"This functionality requires plotly {_MIN_PLOTLY_VERSION_STR} or "
+            f"newer, but version {plotly.__version__} is installed."
+        )
+
+    return go
+
+
+@lru_cache(maxsize=None)
+def _get_mix_colors():
+    # numba is optional and, like plotly, only imported when first needed
+    try:
+        from numba import njit
+    except ImportError:
+        return _mix_colors
+
+    @njit(cache=True)
+    def mix_colors(colors, alphas):
+        mixed = np.empty(colors.shape, dtype=np.int64)
+        for i in range(colors.shape[0]):
+            for k in range(3):
+                mixed[i, k] = int(colors[i, k] * alphas[i] + 220 * (1.0 - alphas[i]))
+        return mixed
+
+    return mix_colors
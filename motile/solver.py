@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, TypeVar, cast
+from typing import TYPE_CHECKING, Iterable, TypeVar, cast
 
 import ilpy
 import numpy as np
 
+from ._types import LinearConstraints
 from .constraints import SelectEdgeNodes
 from .constraints.constraint import Constraint
 from .costs import Features, Weight, Weights
@@ -49,7 +50,7 @@ class Solver:
 
         self.ilp_solver: ilpy.LinearSolver | None = None
         self.objective: ilpy.LinearObjective | None = None
-        self.constraints = ilpy.LinearConstraints()
+        self.constraints = LinearConstraints()
 
         self.num_variables: int = 0
         self._costs = np.zeros((0,), dtype=np.float32)
@@ -107,8 +108,7 @@ class Solver:
 
         logger.info("Adding %s constraints...", type(constraints).__name__)
 
-        for constraint in constraints.instantiate(self):
-            self.constraints.add(constraint)
+        self._add_linear_constraints(constraints.instantiate(self))
 
     def solve(self, timeout: float = 0.0, num_threads: int = 1) -> ilpy.Solution:
         """Solve the global optimization problem.
@@ -190,6 +190,19 @@ class Solver:
         feature_index = self.weights.index_of(weight)
         self.features.add_feature(variable_index, feature_index, value)
 
+    def add_variable_costs(
+        self, indices: np.ndarray, values: np.ndarray, weight: Weight
+    ) -> None:
+        """Add costs for several variables at once.
+
+        Equivalent to calling :func:`add_variable_cost` for each pair of
+        ``indices`` and ``values``, but avoids the per-variable overhead.
+        To be used within implementations of :class:`motile.costs.Costs`.
+        """
+
+        feature_index = self.weights.index_of(weight)
+        self.features.add_features(indices, feature_index, values)
+
     def fit_weights(
         self,
         gt_attribute: str,
@@ -249,11 +262,20 @@ class Solver:
         for index in indices:
             self.variable_types[index] = cls.variable_type
 
-        for constraint in cls.instantiate_constraints(self):
-            self.constraints.add(constraint)
+        self._add_linear_constraints(cls.instantiate_constraints(self))
 
         self.features.resize(num_variables=self.num_variables)
 
+    def _add_linear_constraints(
+        self, constraints: Iterable[ilpy.LinearConstraint] | LinearConstraints
+    ) -> None:
+        # collections of constraints are added with a single call
+        if isinstance(constraints, LinearConstraints):
+            self.constraints.add_all(constraints)
+        else:
+            for constraint in constraints:
+                self.constraints.add(constraint)
+
     def _compute_costs(self) -> None:
         logger.info("Computing costs...")
 
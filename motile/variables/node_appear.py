@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Collection, Iterable
+from typing import TYPE_CHECKING, Collection
 
 import ilpy
 
+from motile._types import LinearConstraints
+
 from .edge_selected import EdgeSelected
 from .node_selected import NodeSelected
 from .variable import Variable
@@ -12,6 +14,33 @@ if TYPE_CHECKING:
     from motile._types import NodeId
     from motile.solver import Solver
 
+# Bulk constructor of newer ilpy versions, sets all coefficients in one call.
+# Those versions renamed LinearConstraint to Constraint and warn when the old
+# name is accessed, so the new name is looked up first.
+_from_coefficients = getattr(
+    getattr(ilpy, "Constraint", None) or ilpy.LinearConstraint,
+    "from_coefficients",
+    None,
+)
+
+
+def _linear_constraint(
+    coefficients: dict[int, float], relation: ilpy.Relation, value: float
+) -> ilpy.LinearConstraint:
+    """Create a linear constraint from a dictionary mapping variable indices
+    to coefficients, using ilpy's bulk constructor if available."""
+
+    if _from_coefficients is not None:
+        return _from_coefficients(coefficients, relation=relation, value=value)
+
+    constraint = ilpy.LinearConstraint()
+    for index, coefficient in coefficients.items():
+        constraint.set_coefficient(index, coefficient)
+    constraint.set_relation(relation)
+    constraint.set_value(value)
+
+    return constraint
+
 
 class NodeAppear(Variable["NodeId"]):
     r"""A binary variable for each node that indicates whether the node is the
@@ -39,25 +68,37 @@ class NodeAppear(Variable["NodeId"]):
         return solver.graph.nodes
 
     @staticmethod
-    def instantiate_constraints(solver: Solver) -> Iterable[ilpy.LinearConstraint]:
+    def instantiate_constraints(solver: Solver) -> LinearConstraints:
         appear_indicators = solver.get_variables(NodeAppear)
         node_indicators = solver.get_variables(NodeSelected)
         edge_indicators = solver.get_variables(EdgeSelected)
 
+        # bind frequently used names locally, this loop runs once per node
+        LessEqual = ilpy.Relation.LessEqual
+        GreaterEqual = ilpy.Relation.GreaterEqual
+        Equal = ilpy.Relation.Equal
+        prev_edges_map = solver.graph.prev_edges
+
+        constraints = LinearConstraints()
+
+        # equality constraints for nodes without incoming edges (typically all
+        # nodes in the first frame), added together after all other nodes
+        equalities: list[ilpy.LinearConstraint] = []
+
         for node in solver.graph.nodes:
-            prev_edges = solver.graph.prev_edges[node]
+            node_index = node_indicators[node]
+            appear_index = appear_indicators[node]
+            prev_edges = prev_edges_map[node]
             num_prev_edges = len(prev_edges)
 
             if num_prev_edges == 0:
                 # special case: no incoming edges, appear indicator is equal to
                 # selection indicator
-                constraint = ilpy.LinearConstraint()
-                constraint.set_coefficient(node_indicators[node], 1.0)
-                constraint.set_coefficient(appear_indicators[node], -1.0)
-                constraint.set_relation(ilpy.Relation.Equal)
-                constraint.set_value(0.0)
-
-                yield constraint
+                equalities.append(
+                    _linear_constraint(
+                        {node_index: 1.0, appear_index: -1.0}, Equal, 0.0
+                    )
+                )
 
                 continue
 
@@ -72,33 +113,29 @@ class NodeAppear(Variable["NodeId"]):
             # (1) s - appear <= num_prev - 1
             # (2) s - appear * num_prev >= 0
 
-            constraint1 = ilpy.LinearConstraint()
-            constraint2 = ilpy.LinearConstraint()
-
             # set s for both constraints:
 
             # num_prev * selected
-            constraint1.set_coefficient(node_indicators[node], num_prev_edges)
-            constraint2.set_coefficient(node_indicators[node], num_prev_edges)
+            coefficients: dict[int, float] = {node_index: num_prev_edges}
 
             # - sum(prev_selected)
             for prev_edge in prev_edges:
-                constraint1.set_coefficient(edge_indicators[prev_edge], -1.0)
-                constraint2.set_coefficient(edge_indicators[prev_edge], -1.0)
+                coefficients[edge_indicators[prev_edge]] = -1.0
 
             # constraint specific parts:
 
             # - appear
-            constraint1.set_coefficient(appear_indicators[node], -1.0)
+            coefficients1 = {**coefficients, appear_index: -1.0}
 
             # - appear * num_prev
-            constraint2.set_coefficient(appear_indicators[node], -num_prev_edges)
+            coefficients2 = {**coefficients, appear_index: -num_prev_edges}
 
-            constraint1.set_relation(ilpy.Relation.LessEqual)
-            constraint2.set_relation(ilpy.Relation.GreaterEqual)
+            constraints.add(
+                _linear_constraint(coefficients1, LessEqual, num_prev_edges - 1)
+            )
+            constraints.add(_linear_constraint(coefficients2, GreaterEqual, 0))
 
-            constraint1.set_value(num_prev_edges - 1)
-            constraint2.set_value(0)
+        for equality in equalities:
+            constraints.add(equality)
 
-            yield constraint1
-            yield constraint2
+        return constraints
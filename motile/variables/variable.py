@@ -15,6 +15,7 @@ from typing import (
 import ilpy
 
 if TYPE_CHECKING:
+    from motile._types import LinearConstraints
     from motile.solver import Solver
 
 _KT = TypeVar("_KT", bound=Hashable)
@@ -89,7 +90,9 @@ class Variable(ABC, Mapping[_KT, int]):
         pass
 
     @staticmethod
-    def instantiate_constraints(solver: Solver) -> Iterable[ilpy.LinearConstraint]:
+    def instantiate_constraints(
+        solver: Solver,
+    ) -> Iterable[ilpy.LinearConstraint] | LinearConstraints:
         """Add linear constraints to the solver to ensure that these variables
         are coupled to other variables of the solver.
 
@@ -102,7 +105,8 @@ class Variable(ABC, Mapping[_KT, int]):
 
             A iterable of :class:`ilpy.LinearConstraint`. See
             :class:`motile.constraints.Constraint` for how to create linear
-            constraints.
+            constraints. Alternatively, an :class:`ilpy.LinearConstraints`
+            collection, which the solver adds in a single call.
         """
         return []
 
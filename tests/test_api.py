@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 
 import motile
+import numpy as np
 from data import (
     create_arlo_nx_graph,
     create_arlo_trackgraph,
@@ -8,7 +10,8 @@ from data import (
     create_toy_hyperedge_trackgraph,
 )
 from motile.constraints import MaxChildren, MaxParents
-from motile.costs import Appear, EdgeSelection, NodeSelection, Split
+from motile.costs import Appear, EdgeSelection, NodeSelection, Split, Weight
+from motile.variables import NodeAppear
 
 
 class TestAPI(unittest.TestCase):
@@ -48,3 +51,53 @@ class TestAPI(unittest.TestCase):
         solution = solver.solve()
 
         assert solution.get_value() == -200
+
+    def test_add_variable_costs(self):
+        def create_solver():
+            solver = motile.Solver(create_arlo_trackgraph())
+            weight = Weight(1.0)
+            solver.weights.add_weight(weight, "weight")
+            return solver, weight
+
+        # repeated indices, and indices past the current number of variables
+        num_variables = create_solver()[0].num_variables
+        indices = np.array([0, 3, 3, 1, num_variables + 4, 3])
+        values = np.array([1.0, 2.0, -0.5, 4.0, 3.0, 0.25])
+
+        batched_solver, weight = create_solver()
+        batched_solver.add_variable_costs(indices, values, weight)
+
+        solver, weight = create_solver()
+        for index, value in zip(indices, values):
+            solver.add_variable_cost(index, value, weight)
+
+        batched_features = batched_solver.features.to_ndarray()
+        features = solver.features.to_ndarray()
+        assert batched_features.shape == (num_variables + 5, 1)
+        np.testing.assert_array_equal(batched_features, features)
+
+    def test_variable_constraints_collection(self):
+        def solver_constraints():
+            solver = motile.Solver(create_toy_hyperedge_trackgraph())
+            solver.get_variables(NodeAppear)
+            return [
+                (c.get_coefficients(), c.get_relation(), c.get_value())
+                for c in solver.constraints
+            ]
+
+        # NodeAppear returns an ilpy.LinearConstraints collection
+        collection_constraints = solver_constraints()
+
+        # the same constraints, yielded one by one
+        instantiate_constraints = NodeAppear.instantiate_constraints
+
+        def generator(solver):
+            yield from instantiate_constraints(solver)
+
+        with mock.patch.object(
+            NodeAppear, "instantiate_constraints", staticmethod(generator)
+        ):
+            generator_constraints = solver_constraints()
+
+        assert len(collection_constraints) > 0
+        assert collection_constraints == generator_constraints
@@ -1,10 +1,11 @@
 import unittest
+from unittest import mock
 
 import motile
-from data import create_arlo_trackgraph
+from data import create_arlo_trackgraph, create_toy_hyperedge_trackgraph
 from motile.constraints import MaxChildren, MaxParents, Pin
 from motile.costs import Appear, EdgeSelection, NodeSelection, Split
-from motile.variables import EdgeSelected
+from motile.variables import EdgeSelected, NodeAppear, node_appear
 
 
 class TestConstraints(unittest.TestCase):
@@ -34,3 +35,21 @@ class TestConstraints(unittest.TestCase):
 
         assert (0, 2) not in selected_edges
         assert (3, 6) in selected_edges
+
+    def test_node_appear_without_bulk_constructor(self):
+        def constraints(graph):
+            solver = motile.Solver(graph)
+            solver.get_variables(NodeAppear)
+            return [
+                (c.get_coefficients(), c.get_relation(), c.get_value())
+                for c in NodeAppear.instantiate_constraints(solver)
+            ]
+
+        for graph in (create_arlo_trackgraph(), create_toy_hyperedge_trackgraph()):
+            bulk = constraints(graph)
+            # ilpy versions without LinearConstraint.from_coefficients
+            with mock.patch.object(node_appear, "_from_coefficients", None):
+                fallback = constraints(graph)
+
+            assert len(bulk) == len(fallback) > 0
+            assert bulk == fallback
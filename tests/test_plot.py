@@ -0,0 +1,139 @@
+import motile
+import networkx
+import numpy as np
+import pytest
+from data import create_toy_hyperedge_trackgraph
+from motile.plot import _get_mix_colors, _mix_colors, draw_track_graph, to_rgba
+
+# motile.plot imports plotly only when drawing
+pytest.importorskip("plotly")
+
+
+def test_draw_track_graph_string_node_ids():
+    # node IDs are neither integers nor row indices in insertion order
+    nx_graph = networkx.DiGraph()
+    nx_graph.add_node("b", t=1, x=20)
+    nx_graph.add_node("a", t=0, x=10)
+    nx_graph.add_node("c", t=2, x=30)
+    nx_graph.add_edge("a", "b")
+    nx_graph.add_edge("b", "c")
+    graph = motile.TrackGraph(nx_graph)
+
+    fig = draw_track_graph(graph)
+
+    # edges are ordered by their source node, i.e., ("b", "c") comes first
+    (edge_trace,) = [trace for trace in fig.data if trace.mode == "lines"]
+    np.testing.assert_array_equal(edge_trace.x, [1, 2, np.nan, 0, 1, np.nan])
+    np.testing.assert_array_equal(edge_trace.y, [20, 30, np.nan, 10, 20, np.nan])
+
+
+def test_draw_track_graph_integer_node_ids():
+    # integer node IDs that are not 0..N-1 in insertion order, using them as
+    # row indices would place edges at the wrong nodes (or out of bounds)
+    nx_graph = networkx.DiGraph()
+    nx_graph.add_node(1, t=1, x=20)
+    nx_graph.add_node(0, t=2, x=30)
+    nx_graph.add_node(7, t=0, x=10)
+    nx_graph.add_edge(7, 1)
+    nx_graph.add_edge(1, 0)
+    graph = motile.TrackGraph(nx_graph)
+
+    fig = draw_track_graph(graph)
+
+    # edges are ordered by their source node, i.e., (1, 0) comes first
+    (edge_trace,) = [trace for trace in fig.data if trace.mode == "lines"]
+    np.testing.assert_array_equal(edge_trace.x, [1, 2, np.nan, 0, 1, np.nan])
+    np.testing.assert_array_equal(edge_trace.y, [20, 30, np.nan, 10, 20, np.nan])
+
+
+def test_draw_track_graph_requires_recent_plotly(monkeypatch):
+    import plotly
+
+    monkeypatch.setattr(plotly, "__version__", "5.10.0")
+
+    nx_graph = networkx.DiGraph()
+    nx_graph.add_node(0, t=0, x=0)
+    nx_graph.add_node(1, t=1, x=0)
+    nx_graph.add_edge(0, 1)
+    graph = motile.TrackGraph(nx_graph)
+
+    with pytest.raises(ImportError, match=r"5\.11"):
+        draw_track_graph(graph)
+
+
+def test_draw_track_graph_hyperedges():
+    graph = create_toy_hyperedge_trackgraph()
+    num_regular_edges = len(graph.edges) - 1
+
+    fig = draw_track_graph(graph)
+
+    # hyperedge ((0,), (2, 3)) is drawn as two segments, 0->2 and 0->3
+    (edge_trace,) = [trace for trace in fig.data if trace.mode == "lines"]
+    assert len(edge_trace.x) == 3 * (num_regular_edges + 2)
+    segments = np.stack((edge_trace.x, edge_trace.y), axis=1).reshape(-1, 3, 2)
+    starts_ends = {tuple(map(tuple, segment[:2])) for segment in segments}
+    assert ((0, 1), (1, 0)) in starts_ends
+    assert ((0, 1), (1, 26)) in starts_ends
+
+    # one label per edge, the hyperedge label sits between its segments
+    (label_trace,) = [trace for trace in fig.data if trace.mode == "text"]
+    assert len(label_trace.x) == len(graph.edges)
+    row = list(graph.edges).index(((0,), (2, 3)))
+    assert label_trace.x[row] == pytest.approx(0.4)
+    assert label_trace.y[row] == pytest.approx(0.6 * 1 + 0.4 * 13)
+
+
+def test_draw_track_graph_color_lists():
+    nx_graph = networkx.DiGraph()
+    nx_graph.add_node(0, t=0, x=10)
+    nx_graph.add_node(1, t=1, x=20)
+    nx_graph.add_node(2, t=2, x=30)
+    nx_graph.add_edge(0, 1)
+    nx_graph.add_edge(1, 2)
+    graph = motile.TrackGraph(nx_graph)
+
+    fig = draw_track_graph(
+        graph,
+        node_color=[(255, 0, 0), (0, 255, 0), (0, 0, 255)],
+        edge_color=[(1, 2, 3), (4, 5, 6)],
+    )
+
+    (node_trace,) = [trace for trace in fig.data if trace.mode == "markers+text"]
+    assert list(node_trace.marker.color) == [
+        "rgb(255,0,0)",
+        "rgb(0,255,0)",
+        "rgb(0,0,255)",
+    ]
+
+    # one line trace per edge color, each with a single segment
+    edge_traces = {
+        trace.line.color: trace for trace in fig.data if trace.mode == "lines"
+    }
+    assert set(edge_traces) == {"rgb(1,2,3)", "rgb(4,5,6)"}
+    np.testing.assert_array_equal(edge_traces["rgb(1,2,3)"].x, [0, 1, np.nan])
+    np.testing.assert_array_equal(edge_traces["rgb(4,5,6)"].x, [1, 2, np.nan])
+
+
+def test_mix_colors_kernel():
+    # the numba kernel (if numba is installed) matches the NumPy version
+    rng = np.random.default_rng(42)
+    colors = rng.integers(0, 256, size=(100, 3)).astype(np.float64)
+    alphas = np.concatenate((rng.random(96), [0.0, 0.5, 1.0, -0.0]))
+
+    np.testing.assert_array_equal(
+        _get_mix_colors()(colors, alphas), _mix_colors(colors, alphas)
+    )
+
+
+def test_to_rgba_four_components():
+    # only the RGB components are used, alpha comes from the alpha argument
+    assert to_rgba((1, 2, 3, 255), [0.5]) == [to_rgba((1, 2, 3, 255), 0.5)]
+
+
+@pytest.mark.parametrize("color", [(255, 0, 0), (12, 34, 56), (1, 2, 3, 255)])
+@pytest.mark.parametrize(
+    "alphas", [[0.0, 0.3, 1.0], np.array([0.0, 0.3, 1.0]), np.linspace(0, 1, 11)]
+)
+def test_to_rgba_alpha_array(color, alphas):
+    # a list or array of alphas gives the same colors as one alpha at a time
+    assert to_rgba(color, alphas) == [to_rgba(color, a) for a in alphas]